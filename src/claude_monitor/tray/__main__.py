@@ -4,6 +4,7 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import List
 
 
 def setup_logging() -> None:
@@ -38,33 +39,55 @@ def parse_args() -> argparse.Namespace:
         "--refresh-rate",
         type=int,
         default=None,
-        help="Refresh rate in seconds (default: 60)",
+        help="Refresh rate in seconds, 10-300 (default: 60)",
     )
     return parser.parse_args()
 
 
+def _find_tray_pids() -> List[int]:
+    """Find PIDs of processes whose command line mentions the tray app."""
+    import subprocess
+
+    proc = Path("/proc")
+    if not proc.is_dir():
+        # No procfs (e.g. macOS); fall back to pgrep
+        result = subprocess.run(
+            ["pgrep", "-f", "claude-monitor-tray"],
+            capture_output=True,
+            text=True,
+        )
+        return [int(pid_str) for pid_str in result.stdout.split()]
+
+    pids = []
+    for proc_dir in proc.iterdir():
+        if not proc_dir.name.isdigit():
+            continue
+        try:
+            cmdline = (proc_dir / "cmdline").read_bytes()
+        except OSError:
+            continue  # Process exited or is not readable
+        if b"claude-monitor-tray" in cmdline:
+            pids.append(int(proc_dir.name))
+    return pids
+
+
 def kill_existing_instances() -> None:
     """Kill any existing tray app instances."""
     import os
     import signal
-    import subprocess
 
     try:
         # Find and kill existing instances (excluding current process)
         current_pid = os.getpid()
-        result = subprocess.run(
-            ["pgrep", "-f", "claude-monitor-tray"],
-            capture_output=True,
-            text=True,
-        )
-        if result.stdout:
-            for pid_str in result.stdout.strip().split("\n"):
-                if pid_str:
-                    pid = int(pid_str)
-                    if pid != current_pid:
-                        os.kill(pid, signal.SIGTERM)
-    except Exception:
-        pass  # Ignore errors
+        for pid in _find_tray_pids():
+            if pid == current_pid:
+                continue
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                continue  # Already exited or not ours to kill
+    except Exception as e:
+        logging.getLogger(__name__).debug(f"Could not kill existing instances: {e}")
 
 
 def main() -> int:
@@ -91,19 +114,31 @@ def main() -> int:
         logger.info("Starting Claude Monitor Tray application")
 
         # Load and update settings from CLI args
-        from claude_monitor.tray.settings import TraySettingsManager
+        from claude_monitor.tray.settings import (
+            TraySettingsManager,
+            clamp_refresh_rate,
+        )
 
         settings_manager = TraySettingsManager()
         settings = settings_manager.load()
 
-        # Override from CLI args
+        # Override from CLI args, saving once for all changes
+        dirty = False
         if args.plan:
             settings.plan = args.plan
-            settings_manager.save(settings)
+            dirty = True
             logger.info(f"Plan set to: {args.plan}")
 
         if args.refresh_rate:
-            settings.refresh_rate = args.refresh_rate
+            settings.refresh_rate = clamp_refresh_rate(args.refresh_rate)
+            if settings.refresh_rate != args.refresh_rate:
+                logger.warning(
+                    f"Refresh rate {args.refresh_rate}s out of range, "
+                    f"using {settings.refresh_rate}s"
+                )
+            dirty = True
+
+        if dirty:
             settings_manager.save(settings)
 
         # Import and run app
@@ -1,27 +1,90 @@
-"""Simplified tray application that reads from status file."""
+"""Simplified tray application that keeps status in memory.
+
+The status file is written for external readers; the tray only reads it back
+once at startup to show the last known state.
+"""
 
 import json
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-from PyQt6.QtCore import QTimer, pyqtSlot
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
 
 from claude_monitor.tray.icons import IconState, TrayIconManager
 from claude_monitor.tray.menu import TrayMenuBuilder
 from claude_monitor.tray.settings import TraySettings, TraySettingsManager
-from claude_monitor.tray.stats_window import StatsWindow
-from claude_monitor.tray.settings_dialog import SettingsDialog
 from claude_monitor.tray.autostart import AutostartManager
-from claude_monitor.tray.status_generator import write_status_file, read_status_file, STATUS_FILE
+from claude_monitor.tray.status_generator import (
+    parse_reset_epoch,
+    read_status_file,
+    write_status_file,
+)
+
+if TYPE_CHECKING:
+    from claude_monitor.tray.settings_dialog import SettingsDialog
+    from claude_monitor.tray.stats_window import StatsWindow
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _fmt_num(n: int) -> str:
+    """Format number."""
+    if n >= 1_000_000:
+        return f"{n/1_000_000:.1f}M"
+    if n >= 1_000:
+        return f"{n/1_000:.1f}k"
+    return str(n)
+
+
+class _StatusSignals(QObject):
+    """Signals used to hand worker results back to the GUI thread."""
+
+    status_ready = pyqtSignal(object)  # Emits status dict
+
+
+class _StatusWorker(QRunnable):
+    """Generates and writes status off the GUI thread.
+
+    The result is emitted through ``_StatusSignals.status_ready``; the
+    tray applies it and forwards it to the stats window when visible.
+    """
+
+    def __init__(self, plan: str, signals: _StatusSignals) -> None:
+        super().__init__()
+        self._plan = plan
+        self._signals = signals
+
+    def run(self) -> None:
+        # Always emit: the tray's in-flight guard is only cleared by the signal
+        try:
+            status = write_status_file(self._plan)
+        except Exception as e:
+            logger.exception(f"Status worker failed: {e}")
+            status = {"error": str(e), "timestamp": datetime.now().isoformat()}
+        self._signals.status_ready.emit(status)
+
+
 class TrayApplication(QApplication):
-    """Simple system tray app that reads status from file."""
+    """Simple system tray app showing Claude usage status."""
+
+    # Refresh runs this many times slower while nobody is looking
+    SLOW_REFRESH_FACTOR = 5
+    # How long tray interaction keeps the fast refresh rate
+    FAST_REFRESH_HOLD_MS = 30_000
 
     def __init__(self, argv: list) -> None:
         super().__init__(argv)
@@ -40,24 +103,49 @@ class TrayApplication(QApplication):
         self._menu_builder = TrayMenuBuilder()
 
         # Windows
-        self._stats_window: Optional[StatsWindow] = None
+        self._stats_window: Optional["StatsWindow"] = None
+        self._settings_dialog: Optional["SettingsDialog"] = None
 
         # Status data
-        self._status: Optional[Dict[str, Any]] = None
+        self._status_dict: Optional[Dict[str, Any]] = None
+        self._last_reset_str = ""
+        self._reset_epoch: Optional[float] = None
+        self._last_state: Optional[IconState] = None
+        self._last_tooltip = ""
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        pool = QThreadPool.globalInstance()
+        assert pool is not None
+        self._pool = pool
+        self._status_signals = _StatusSignals(self)
+        # Results always arrive from a pool thread; queue them onto the GUI thread
+        # (PyQt6's stubs omit the connection-type argument of connect())
+        self._status_signals.status_ready.connect(  # type: ignore[call-arg]
+            self._on_status_ready, Qt.ConnectionType.QueuedConnection
+        )
 
         # Setup tray
         self._tray_icon = QSystemTrayIcon(self)
         self._setup_tray()
         self._connect_signals()
 
-        # Refresh timer
+        # Refresh timer: fast while the user is looking, slow otherwise
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._timer.timeout.connect(self._refresh)
+        self._fast_refresh = False
+        self._fast_interval = 0
+        self._slow_interval = 0
+        self._update_intervals()
+
+        self._fast_hold_timer = QTimer(self)
+        self._fast_hold_timer.setSingleShot(True)
+        self._fast_hold_timer.timeout.connect(self._on_fast_hold_expired)
 
     def _setup_tray(self) -> None:
         """Setup tray icon."""
-        self._tray_icon.setIcon(self._icon_manager.get_icon(IconState.LOADING))
-        self._tray_icon.setToolTip("Claude Monitor\nLoading...")
+        self._set_icon_state(IconState.LOADING)
+        self._set_tooltip("Claude Monitor\nLoading...")
         self._tray_icon.setContextMenu(self._menu_builder.build_menu())
         self._tray_icon.activated.connect(self._on_activated)
 
@@ -72,111 +160,187 @@ class TrayApplication(QApplication):
         """Start the app."""
         logger.info("Starting tray app")
         self._tray_icon.show()
+
+        # Show the last known status while the initial refresh runs
+        self._status_dict = read_status_file()
+        if self._status_dict and "error" not in self._status_dict:
+            self._update_from_status()
+
         self._refresh()  # Initial refresh
-        self._timer.start(self._settings.refresh_rate * 1000)
+        self._timer.start(self._slow_interval)
+
+    def _update_intervals(self) -> None:
+        """Recompute refresh intervals from settings."""
+        self._fast_interval = self._settings.refresh_rate * 1000
+        self._slow_interval = self._fast_interval * self.SLOW_REFRESH_FACTOR
+
+    def _set_fast_refresh(self, fast: bool) -> None:
+        """Switch the refresh timer between fast and slow intervals."""
+        self._fast_refresh = fast
+        # Precise timing only matters while the user is watching; coarse
+        # timers let the kernel coalesce background wakeups
+        self._timer.setTimerType(
+            Qt.TimerType.PreciseTimer if fast else Qt.TimerType.CoarseTimer
+        )
+        self._timer.setInterval(
+            self._fast_interval if fast else self._slow_interval
+        )
+
+    def _hold_fast_refresh(self) -> None:
+        """Refresh now and keep the fast interval for a while."""
+        self._refresh()
+        self._set_fast_refresh(True)
+        self._fast_hold_timer.start(self.FAST_REFRESH_HOLD_MS)
+
+    def _on_fast_hold_expired(self) -> None:
+        """Drop back to slow refresh unless the stats window is open."""
+        if not (self._stats_window and self._stats_window.isVisible()):
+            self._set_fast_refresh(False)
+
+    def _on_stats_closed(self) -> None:
+        """Drop back to slow refresh once the stats window closes."""
+        if not self._fast_hold_timer.isActive():
+            self._set_fast_refresh(False)
 
     def _refresh(self) -> None:
-        """Refresh status data."""
-        logger.debug("Refreshing status")
+        """Start a background status refresh."""
+        if self._refresh_in_flight:
+            # Re-run once the current refresh lands so new settings apply
+            self._refresh_pending = True
+            return
 
-        # Generate fresh status file
-        plan = self._settings.plan
-        write_status_file(plan)
+        logger.debug("Refreshing status")
+        self._refresh_in_flight = True
+        self._pool.start(_StatusWorker(self._settings.plan, self._status_signals))
 
-        # Read status
-        self._status = read_status_file()
+    @pyqtSlot(object)
+    def _on_status_ready(self, status: Dict[str, Any]) -> None:
+        """Apply status generated by the background worker."""
+        self._refresh_in_flight = False
+        self._status_dict = status
 
-        if self._status and "error" not in self._status:
+        if self._status_dict and "error" not in self._status_dict:
             self._update_from_status()
         else:
             self._show_error()
 
         # Update stats window if open
         if self._stats_window and self._stats_window.isVisible():
-            self._stats_window.update_status(self._status)
+            self._stats_window.update_status(self._status_dict)
+
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh()
 
     def _update_from_status(self) -> None:
         """Update tray from status data."""
-        if not self._status:
+        if not self._status_dict:
             return
 
-        session = self._status.get("session", {})
+        session = self._status_dict.get("session", {})
         tokens_pct = session.get("tokens_pct", 0)
 
         # Update icon
         ratio = tokens_pct / 100.0
-        self._tray_icon.setIcon(self._icon_manager.get_icon_for_usage(ratio))
+        self._set_icon_state(self._icon_manager.get_state_for_usage(ratio))
 
         # Update tooltip
         tokens = session.get("tokens", 0)
-        limit = self._status.get("token_limit", 0)
+        limit = self._status_dict.get("token_limit", 0)
         cost = session.get("cost", 0)
-        reset = self._format_reset(session.get("reset_time", ""))
+        self._set_reset_time(session.get("reset_time", ""), session.get("reset_epoch"))
+        reset = self._format_reset()
 
         tooltip = (
             f"Claude Monitor\n"
-            f"Tokens: {self._fmt_num(tokens)} / {self._fmt_num(limit)} ({tokens_pct}%)\n"
+            f"Tokens: {_fmt_num(tokens)} / {_fmt_num(limit)} ({tokens_pct}%)\n"
             f"Cost: ${cost:.2f}\n"
             f"{reset}"
         )
-        self._tray_icon.setToolTip(tooltip)
+        self._set_tooltip(tooltip)
 
     def _show_error(self) -> None:
         """Show error state."""
-        self._tray_icon.setIcon(self._icon_manager.get_icon(IconState.ERROR))
-        error = self._status.get("error", "Unknown error") if self._status else "No data"
-        self._tray_icon.setToolTip(f"Claude Monitor\nError: {error}")
+        self._set_icon_state(IconState.ERROR)
+        error = (
+            self._status_dict.get("error", "Unknown error")
+            if self._status_dict
+            else "No data"
+        )
+        self._set_tooltip(f"Claude Monitor\nError: {error}")
+
+    def _set_icon_state(self, state: IconState) -> None:
+        """Set tray icon unless it already shows this state."""
+        if state != self._last_state:
+            self._tray_icon.setIcon(self._icon_manager.get_icon(state))
+            self._last_state = state
+
+    def _set_tooltip(self, tooltip: str) -> None:
+        """Set tray tooltip unless the text is unchanged."""
+        if tooltip != self._last_tooltip:
+            self._tray_icon.setToolTip(tooltip)
+            self._last_tooltip = tooltip
+
+    def _set_reset_time(self, reset_time: str, reset_epoch: Optional[float]) -> None:
+        """Track the reset time in epoch seconds.
+
+        Status files written before ``reset_epoch`` existed only carry the ISO
+        string; it is parsed once per distinct value.
+        """
+        if reset_epoch is None and reset_time != self._last_reset_str:
+            reset_epoch = parse_reset_epoch(reset_time)
+        elif reset_epoch is None:
+            return
+        self._last_reset_str = reset_time
+        self._reset_epoch = reset_epoch
 
-    def _format_reset(self, reset_time: str) -> str:
-        """Format reset time."""
-        if not reset_time:
+    def _format_reset(self) -> str:
+        """Format time remaining until reset."""
+        if self._reset_epoch is None:
             return ""
-        try:
-            if "+" in reset_time:
-                reset_time = reset_time.split("+")[0]
-            end = datetime.fromisoformat(reset_time)
-            now = datetime.now()
-            if end > now:
-                delta = end - now
-                hours = int(delta.total_seconds() // 3600)
-                mins = int((delta.total_seconds() % 3600) // 60)
-                return f"Resets in {hours}h {mins}m"
-        except:
-            pass
-        return ""
-
-    def _fmt_num(self, n: int) -> str:
-        """Format number."""
-        if n >= 1_000_000:
-            return f"{n/1_000_000:.1f}M"
-        if n >= 1_000:
-            return f"{n/1_000:.1f}k"
-        return str(n)
+        remaining = int(self._reset_epoch - time.time())
+        if remaining <= 0:
+            return ""
+        hours, rest = divmod(remaining, 3600)
+        return f"Resets in {hours}h {rest // 60}m"
 
     @pyqtSlot(QSystemTrayIcon.ActivationReason)
     def _on_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            self._hold_fast_refresh()
             self._show_stats()
+        elif reason == QSystemTrayIcon.ActivationReason.Context:
+            self._hold_fast_refresh()
         elif reason == QSystemTrayIcon.ActivationReason.MiddleClick:
             self._refresh()
 
     def _show_stats(self) -> None:
         """Show stats window."""
         if not self._stats_window:
+            # Imported on first use; most sessions never open the window
+            from claude_monitor.tray.stats_window import StatsWindow
+
             self._stats_window = StatsWindow()
-        self._stats_window.update_status(self._status)
+            self._stats_window.closed.connect(self._on_stats_closed)
+        self._set_fast_refresh(True)
+        self._stats_window.update_status(self._status_dict)
         self._stats_window.show()
         self._stats_window.raise_()
         self._stats_window.activateWindow()
 
     def _show_settings(self) -> None:
-        """Show settings dialog."""
-        dialog = SettingsDialog(
-            settings=self._settings,
-            autostart_available=self._autostart_manager.is_available(),
-        )
-        dialog.settings_changed.connect(self._on_settings_changed)
-        dialog.exec()
+        """Show settings dialog, reusing it after the first open."""
+        if self._settings_dialog is None:
+            from claude_monitor.tray.settings_dialog import SettingsDialog
+
+            self._settings_dialog = SettingsDialog(
+                settings=self._settings,
+                autostart_available=self._autostart_manager.is_available(),
+            )
+            self._settings_dialog.settings_changed.connect(self._on_settings_changed)
+        else:
+            self._settings_dialog.set_settings(self._settings)
+        self._settings_dialog.exec()
 
     @pyqtSlot(object)
     def _on_settings_changed(self, new_settings: TraySettings) -> None:
@@ -191,7 +355,8 @@ class TrayApplication(QApplication):
         )
 
         # Update timer
-        self._timer.setInterval(new_settings.refresh_rate * 1000)
+        self._update_intervals()
+        self._set_fast_refresh(self._fast_refresh)
 
         # Update autostart
         self._autostart_manager.set_enabled(new_settings.autostart)
@@ -35,6 +35,7 @@ class AutostartManager:
         """
         self.autostart_dir = autostart_dir or self._get_autostart_dir()
         self.desktop_file = self.autostart_dir / self.DESKTOP_FILE_NAME
+        self._cached_exec_path: Optional[str] = None
 
     def _get_autostart_dir(self) -> Path:
         """Get XDG autostart directory.
@@ -91,6 +92,8 @@ class AutostartManager:
             return True
 
         except Exception as e:
+            # Resolve the executable again on retry in case it moved
+            self._cached_exec_path = None
             logger.error(f"Failed to enable autostart: {e}")
             return False
 
@@ -130,10 +133,10 @@ class AutostartManager:
         Returns:
             Path to execute the tray app
         """
-        # Try to find the installed script
-        exec_path = shutil.which(self.APP_NAME)
-        if exec_path:
-            return exec_path
-
-        # Fall back to python -m
-        return f"{sys.executable} -m claude_monitor.tray"
+        if self._cached_exec_path is None:
+            # Try to find the installed script, fall back to python -m
+            self._cached_exec_path = (
+                shutil.which(self.APP_NAME)
+                or f"{sys.executable} -m claude_monitor.tray"
+            )
+        return self._cached_exec_path
@@ -1,11 +1,23 @@
 """Tray icon generation with color-coded status indicators."""
 
+import bisect
 import logging
 from enum import Enum
-from typing import Dict, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
+from PyQt6.QtGui import (
+    QColor,
+    QGuiApplication,
+    QIcon,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,21 +46,51 @@ class TrayIconManager:
 
     ICON_SIZE = 22  # Standard system tray icon size
 
+    # Part of the on-disk cache key; bump whenever _render_pixmap changes
+    RENDER_VERSION = 2
+
+    # Shared drawing resources, built on first render
+    _PROMPT_PATH: Optional[QPainterPath] = None
+    _pen_cache: Dict[int, QPen] = {}
+
     def __init__(
         self,
         warning_threshold: float = 0.70,
         critical_threshold: float = 0.90,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """Initialize icon manager.
 
         Args:
             warning_threshold: Usage ratio for warning state (0.0-1.0)
             critical_threshold: Usage ratio for critical state (0.0-1.0)
+            cache_dir: Directory for rendered icon PNGs
         """
         self.warning_threshold = warning_threshold
         self.critical_threshold = critical_threshold
         self._icon_cache: Dict[IconState, QIcon] = {}
 
+        # Rendered pixmaps are persisted across launches, keyed by the
+        # inputs that affect drawing (state, size, scale, color and version)
+        self.cache_dir = cache_dir or Path.home() / ".claude-monitor" / "icon_cache"
+        self._dpr = self._device_pixel_ratio()
+        self._cache_keys: Dict[IconState, str] = {
+            state: (
+                f"{state.value}-{self.ICON_SIZE}@{self._dpr:g}x"
+                f"-{color.rgba():08x}-v{self.RENDER_VERSION}"
+            )
+            for state, color in self.COLORS.items()
+        }
+
+        self._tier_states = (IconState.NORMAL, IconState.WARNING, IconState.CRITICAL)
+        self._thresholds = self._build_thresholds()
+        self._cached_state = lru_cache(maxsize=128)(self._compute_state)
+
+        # Render every state up front so refreshes never paint on the GUI thread
+        for state in IconState:
+            self._icon_cache[state] = self._create_icon(state)
+        self._prune_disk_cache()
+
     def get_icon_for_usage(self, usage_ratio: float) -> QIcon:
         """Get appropriate icon based on usage ratio.
 
@@ -58,8 +100,18 @@ class TrayIconManager:
         Returns:
             QIcon with appropriate color
         """
-        state = self._get_state_for_ratio(usage_ratio)
-        return self.get_icon(state)
+        return self.get_icon(self.get_state_for_usage(usage_ratio))
+
+    def get_state_for_usage(self, usage_ratio: float) -> IconState:
+        """Get icon state based on usage ratio.
+
+        Args:
+            usage_ratio: Current usage as ratio (0.0-1.0)
+
+        Returns:
+            IconState for the usage level
+        """
+        return self._get_state_for_ratio(usage_ratio)
 
     def get_icon(self, state: IconState) -> QIcon:
         """Get icon for a specific state.
@@ -70,8 +122,6 @@ class TrayIconManager:
         Returns:
             QIcon for the state
         """
-        if state not in self._icon_cache:
-            self._icon_cache[state] = self._create_icon(state)
         return self._icon_cache[state]
 
     def _get_state_for_ratio(self, ratio: float) -> IconState:
@@ -80,20 +130,51 @@ class TrayIconManager:
         Args:
             ratio: Usage ratio (0.0-1.0)
 
+        Returns:
+            IconState for the ratio
+        """
+        # Ratios come from integer percentages, so rounding keeps hits high
+        return self._cached_state(round(ratio, 2))
+
+    def _compute_state(self, ratio: float) -> IconState:
+        """Compute icon state for a quantized usage ratio.
+
+        Args:
+            ratio: Usage ratio rounded to two decimals
+
         Returns:
             IconState for the ratio
         """
         if ratio < 0:
             return IconState.ERROR
-        elif ratio >= self.critical_threshold:
-            return IconState.CRITICAL
-        elif ratio >= self.warning_threshold:
-            return IconState.WARNING
-        else:
-            return IconState.NORMAL
+        return self._tier_states[bisect.bisect_right(self._thresholds, ratio) - 1]
+
+    def _build_thresholds(self) -> List[float]:
+        """Build ascending lower bounds matching _tier_states.
+
+        Thresholds are not validated on load, so the warning bound is capped
+        at the critical one; critical still wins whenever it is reached.
+
+        Returns:
+            List of tier lower bounds
+        """
+        warning = min(self.warning_threshold, self.critical_threshold)
+        return [0.0, warning, self.critical_threshold]
+
+    @staticmethod
+    def _device_pixel_ratio() -> float:
+        """Get the primary screen's device pixel ratio (1.0 without a screen).
+
+        Returns:
+            Device pixel ratio to render icons at
+        """
+        if QGuiApplication.instance() is None:
+            return 1.0
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen is not None else 1.0
 
     def _create_icon(self, state: IconState) -> QIcon:
-        """Create a Claude Code style icon with '>_' prompt.
+        """Create icon for a state, reusing cached pixmaps where possible.
 
         Args:
             state: IconState to create icon for
@@ -101,7 +182,102 @@ class TrayIconManager:
         Returns:
             QIcon with Claude Code style terminal prompt
         """
-        pixmap = QPixmap(self.ICON_SIZE, self.ICON_SIZE)
+        # Process-wide cache shared by every TrayIconManager instance
+        key = f"cmtray-{self._cache_keys[state]}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return QIcon(pixmap)
+
+        pixmap = self._load_or_render_pixmap(state)
+        QPixmapCache.insert(key, pixmap)
+        return QIcon(pixmap)
+
+    def _load_or_render_pixmap(self, state: IconState) -> QPixmap:
+        """Load a state's pixmap from the disk cache, rendering it on a miss.
+
+        Args:
+            state: IconState to load
+
+        Returns:
+            QPixmap for the state
+        """
+        cache_file = self.cache_dir / f"{self._cache_keys[state]}.png"
+        if cache_file.exists():
+            pixmap = QPixmap(str(cache_file))
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(self._dpr)
+                return pixmap
+
+        pixmap = self._render_pixmap(state)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if not pixmap.save(str(cache_file), "PNG"):
+                logger.debug(f"Failed to cache icon: {cache_file}")
+        except OSError as e:
+            logger.debug(f"Failed to cache icon: {e}")
+
+        return pixmap
+
+    def _prune_disk_cache(self) -> None:
+        """Delete cached PNGs left behind by other versions or pixel ratios."""
+        current = set(self._cache_keys.values())
+        try:
+            for cache_file in self.cache_dir.glob("*.png"):
+                if cache_file.stem not in current:
+                    cache_file.unlink()
+        except OSError as e:
+            logger.debug(f"Failed to prune icon cache: {e}")
+
+    @classmethod
+    def _prompt_path(cls) -> QPainterPath:
+        """Get the '>_' prompt outline, building it once per process.
+
+        Returns:
+            QPainterPath for the terminal prompt
+        """
+        if cls._PROMPT_PATH is None:
+            cy = cls.ICON_SIZE // 2
+            path = QPainterPath()
+            # ">" chevron
+            path.moveTo(4, cy - 4)
+            path.lineTo(9, cy)
+            path.lineTo(4, cy + 4)
+            # "_" underscore/cursor
+            path.moveTo(11, cy + 4)
+            path.lineTo(18, cy + 4)
+            cls._PROMPT_PATH = path
+        return cls._PROMPT_PATH
+
+    @classmethod
+    def _pen(cls, color: QColor) -> QPen:
+        """Get a 2px pen for a color, reusing existing pens.
+
+        Args:
+            color: Pen color
+
+        Returns:
+            QPen for the color
+        """
+        pen = cls._pen_cache.get(color.rgba())
+        if pen is None:
+            pen = QPen(color)
+            pen.setWidth(2)
+            cls._pen_cache[color.rgba()] = pen
+        return pen
+
+    def _render_pixmap(self, state: IconState) -> QPixmap:
+        """Render a Claude Code style icon with '>_' prompt.
+
+        Args:
+            state: IconState to render
+
+        Returns:
+            QPixmap with Claude Code style terminal prompt
+        """
+        # Render at device resolution; painting stays in logical pixels
+        device_size = round(self.ICON_SIZE * self._dpr)
+        pixmap = QPixmap(device_size, device_size)
+        pixmap.setDevicePixelRatio(self._dpr)
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
@@ -126,23 +302,14 @@ class TrayIconManager:
         )
 
         # Draw ">_" prompt in state color
-        pen = QPen(color)
-        pen.setWidth(2)
-        painter.setPen(pen)
-
-        # Draw ">" chevron
-        cx, cy = self.ICON_SIZE // 2, self.ICON_SIZE // 2
-        painter.drawLine(4, cy - 4, 9, cy)
-        painter.drawLine(9, cy, 4, cy + 4)
-
-        # Draw "_" underscore/cursor
-        painter.drawLine(11, cy + 4, 18, cy + 4)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(self._pen(color))
+        painter.drawPath(self._prompt_path())
 
         # Draw X overlay for error state
         if state == IconState.ERROR:
-            pen = QPen(QColor(244, 67, 54))
-            pen.setWidth(2)
-            painter.setPen(pen)
+            painter.setPen(self._pen(QColor(244, 67, 54)))
+            cx, cy = self.ICON_SIZE // 2, self.ICON_SIZE // 2
             offset = 5
             painter.drawLine(
                 cx - offset, cy - offset, cx + offset, cy + offset
@@ -153,7 +320,7 @@ class TrayIconManager:
 
         painter.end()
 
-        return QIcon(pixmap)
+        return pixmap
 
     def update_thresholds(
         self,
@@ -162,6 +329,8 @@ class TrayIconManager:
     ) -> None:
         """Update threshold values.
 
+        Thresholds only select the state, so cached icons stay valid.
+
         Args:
             warning_threshold: New warning threshold (0.0-1.0)
             critical_threshold: New critical threshold (0.0-1.0)
@@ -170,4 +339,6 @@ class TrayIconManager:
             self.warning_threshold = warning_threshold
         if critical_threshold is not None:
             self.critical_threshold = critical_threshold
+        self._thresholds = self._build_thresholds()
+        self._cached_state.cache_clear()
 
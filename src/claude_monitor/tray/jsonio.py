@@ -0,0 +1,32 @@
+"""JSON encoding for tray files, using orjson when it is installed."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """Encode to JSON bytes, compact unless indent is set (2 spaces)."""
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+except ImportError:
+    import json
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """Encode to JSON bytes, compact unless indent is set (2 spaces)."""
+        if indent:
+            return json.dumps(obj, indent=2, sort_keys=sort_keys).encode()
+        return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode()
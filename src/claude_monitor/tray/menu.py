@@ -1,7 +1,7 @@
 """Context menu builder for system tray."""
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QAction
@@ -27,14 +27,17 @@ class TrayMenuBuilder(QObject):
         """
         super().__init__(parent)
         self._menu: Optional[QMenu] = None
-        self._actions: dict = {}
+        self._actions: Dict[str, QAction] = {}
 
     def build_menu(self) -> QMenu:
-        """Build the context menu.
+        """Build the context menu, reusing it if already built.
 
         Returns:
             QMenu instance
         """
+        if self._menu is not None:
+            return self._menu
+
         self._menu = QMenu()
 
         # View Detailed Stats
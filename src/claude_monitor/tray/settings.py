@@ -1,6 +1,5 @@
 """Tray-specific settings management."""
 
-import json
 import logging
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
@@ -8,8 +7,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
+from claude_monitor.tray.jsonio import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Supported refresh rate range in seconds (CLI, settings file and dialog)
+MIN_REFRESH_RATE = 10
+MAX_REFRESH_RATE = 300
+
+
+def clamp_refresh_rate(seconds: int) -> int:
+    """Clamp a refresh rate to the supported range."""
+    return max(MIN_REFRESH_RATE, min(MAX_REFRESH_RATE, seconds))
+
 
 @dataclass
 class TraySettings:
@@ -41,7 +51,7 @@ class TraySettings:
     def from_dict(cls, data: Dict[str, Any]) -> "TraySettings":
         """Create settings from dictionary."""
         return cls(
-            refresh_rate=data.get("refresh_rate", 60),
+            refresh_rate=clamp_refresh_rate(data.get("refresh_rate", 60)),
             plan=data.get("plan", "custom"),
             custom_limit_tokens=data.get("custom_limit_tokens"),
             warning_threshold=data.get("warning_threshold", 0.70),
@@ -64,6 +74,7 @@ class TraySettingsManager:
         self.config_dir = config_dir or Path.home() / ".claude-monitor"
         self.settings_file = self.config_dir / "tray_settings.json"
         self._settings: Optional[TraySettings] = None
+        self._last_saved_dict: Optional[Dict[str, Any]] = None
 
     def load(self) -> TraySettings:
         """Load settings from file.
@@ -79,10 +90,9 @@ class TraySettingsManager:
             return self._settings
 
         try:
-            with open(self.settings_file) as f:
-                data = json.load(f)
-
+            data = loads(self.settings_file.read_bytes())
             self._settings = TraySettings.from_dict(data)
+            self._last_saved_dict = self._settings.to_dict()
             logger.debug(f"Loaded tray settings from {self.settings_file}")
             return self._settings
 
@@ -94,24 +104,32 @@ class TraySettingsManager:
     def save(self, settings: TraySettings) -> bool:
         """Save settings to file.
 
+        The write is skipped when nothing changed since the last load or save
+        and the settings file still exists.
+
         Args:
             settings: TraySettings instance to save
 
         Returns:
             True if successful, False otherwise
         """
+        data = settings.to_dict()
+        if data == self._last_saved_dict and self.settings_file.exists():
+            self._settings = settings
+            return True
+
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
 
-            data = settings.to_dict()
+            snapshot = dict(data)
             data["timestamp"] = datetime.now().isoformat()
 
             temp_file = self.settings_file.with_suffix(".tmp")
-            with open(temp_file, "w") as f:
-                json.dump(data, f, indent=2)
+            temp_file.write_bytes(dumps(data, indent=True))
             temp_file.replace(self.settings_file)
 
             self._settings = settings
+            self._last_saved_dict = snapshot
             logger.debug(f"Saved tray settings to {self.settings_file}")
             return True
 
@@ -3,7 +3,8 @@
 import logging
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSignal
+from PyQt6.QtGui import QShowEvent
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -19,16 +20,47 @@ from PyQt6.QtWidgets import (
 )
 
 from claude_monitor.core.plans import PLAN_LIMITS, PlanType
-from claude_monitor.tray.settings import TraySettings
+from claude_monitor.tray.settings import (
+    MAX_REFRESH_RATE,
+    MIN_REFRESH_RATE,
+    TraySettings,
+)
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_CUSTOM_LIMIT = 44000  # tokens
+
+# (display name, plan value) pairs for the plan selector
+_PLAN_CHOICES = tuple(
+    (PLAN_LIMITS[plan_type]["display_name"], plan_type.value) for plan_type in PlanType
+)
+
+# (attribute name, minimum, maximum, suffix, tooltip) for each plain spin box
+_SPIN_SPECS = (
+    (
+        "refresh",
+        MIN_REFRESH_RATE,
+        MAX_REFRESH_RATE,
+        " seconds",
+        "How often to refresh usage data",
+    ),
+    ("warning", 10, 100, "%", "Usage percentage for yellow icon"),
+    ("critical", 10, 100, "%", "Usage percentage for red icon"),
+    ("notif_threshold", 10, 100, "%", "Usage percentage to trigger notification"),
+)
+
 
 class SettingsDialog(QDialog):
     """Dialog for configuring tray settings."""
 
     settings_changed = pyqtSignal(object)  # Emits TraySettings
 
+    # Created from _SPIN_SPECS in _setup_ui
+    _refresh_spin: QSpinBox
+    _warning_spin: QSpinBox
+    _critical_spin: QSpinBox
+    _notif_threshold_spin: QSpinBox
+
     def __init__(
         self,
         settings: TraySettings,
@@ -45,27 +77,47 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self._settings = settings
         self._autostart_available = autostart_available
+        self._built = False
+
+    def set_settings(self, settings: TraySettings) -> None:
+        """Replace the settings shown the next time the dialog opens.
 
-        self._setup_ui()
-        self._load_settings()
+        Args:
+            settings: Current settings
+        """
+        self._settings = settings
+
+    def showEvent(self, event: Optional[QShowEvent]) -> None:
+        """Build the UI on first show and load current settings."""
+        if event is not None and not event.spontaneous():
+            if not self._built:
+                self._setup_ui()
+                self._built = True
+                self.adjustSize()
+            self._load_settings()
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
-        """Setup the user interface."""
+        """Setup the user interface (deferred until first show)."""
         self.setWindowTitle("Claude Monitor Tray Settings")
         self.setMinimumWidth(350)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
 
+        # Spin boxes, placed into their groups below
+        for name, minimum, maximum, suffix, tooltip in _SPIN_SPECS:
+            spin = QSpinBox()
+            spin.setRange(minimum, maximum)
+            spin.setSuffix(suffix)
+            spin.setToolTip(tooltip)
+            setattr(self, f"_{name}_spin", spin)
+
         # General Settings Group
         general_group = QGroupBox("General")
         general_layout = QFormLayout(general_group)
 
         # Refresh rate
-        self._refresh_spin = QSpinBox()
-        self._refresh_spin.setRange(10, 300)
-        self._refresh_spin.setSuffix(" seconds")
-        self._refresh_spin.setToolTip("How often to refresh usage data")
         general_layout.addRow("Refresh Rate:", self._refresh_spin)
 
         layout.addWidget(general_group)
@@ -76,20 +128,15 @@ class SettingsDialog(QDialog):
 
         # Plan selector
         self._plan_combo = QComboBox()
-        for plan_type in PlanType:
-            display_name = PLAN_LIMITS[plan_type]["display_name"]
-            self._plan_combo.addItem(display_name, plan_type.value)
+        for display_name, plan_value in _PLAN_CHOICES:
+            self._plan_combo.addItem(display_name, plan_value)
         self._plan_combo.currentIndexChanged.connect(self._on_plan_changed)
         plan_layout.addRow("Plan Type:", self._plan_combo)
 
-        # Custom limit
-        self._custom_limit_spin = QSpinBox()
-        self._custom_limit_spin.setRange(1000, 1_000_000)
-        self._custom_limit_spin.setSingleStep(1000)
-        self._custom_limit_spin.setSuffix(" tokens")
-        self._custom_limit_spin.setToolTip("Token limit for custom plan")
-        self._custom_limit_label = QLabel("Custom Limit:")
-        plan_layout.addRow(self._custom_limit_label, self._custom_limit_spin)
+        # Custom limit, built on first switch to the custom plan
+        self._plan_layout = plan_layout
+        self._custom_limit_spin: Optional[QSpinBox] = None
+        self._custom_limit_label: Optional[QLabel] = None
 
         layout.addWidget(plan_group)
 
@@ -97,18 +144,8 @@ class SettingsDialog(QDialog):
         threshold_group = QGroupBox("Thresholds")
         threshold_layout = QFormLayout(threshold_group)
 
-        # Warning threshold
-        self._warning_spin = QSpinBox()
-        self._warning_spin.setRange(10, 100)
-        self._warning_spin.setSuffix("%")
-        self._warning_spin.setToolTip("Usage percentage for yellow icon")
+        # Warning and critical thresholds
         threshold_layout.addRow("Warning:", self._warning_spin)
-
-        # Critical threshold
-        self._critical_spin = QSpinBox()
-        self._critical_spin.setRange(10, 100)
-        self._critical_spin.setSuffix("%")
-        self._critical_spin.setToolTip("Usage percentage for red icon")
         threshold_layout.addRow("Critical:", self._critical_spin)
 
         layout.addWidget(threshold_group)
@@ -123,10 +160,6 @@ class SettingsDialog(QDialog):
         notif_layout.addRow(self._notifications_check)
 
         # Notification threshold
-        self._notif_threshold_spin = QSpinBox()
-        self._notif_threshold_spin.setRange(10, 100)
-        self._notif_threshold_spin.setSuffix("%")
-        self._notif_threshold_spin.setToolTip("Usage percentage to trigger notification")
         notif_layout.addRow("Notify at:", self._notif_threshold_spin)
 
         layout.addWidget(notif_group)
@@ -163,10 +196,10 @@ class SettingsDialog(QDialog):
             self._plan_combo.setCurrentIndex(plan_index)
 
         # Custom limit
-        if self._settings.custom_limit_tokens:
-            self._custom_limit_spin.setValue(self._settings.custom_limit_tokens)
-        else:
-            self._custom_limit_spin.setValue(44000)
+        if self._custom_limit_spin is not None:
+            self._custom_limit_spin.setValue(
+                self._settings.custom_limit_tokens or _DEFAULT_CUSTOM_LIMIT
+            )
 
         self._on_plan_changed()  # Update custom limit visibility
 
@@ -188,8 +221,25 @@ class SettingsDialog(QDialog):
         plan = self._plan_combo.currentData()
         is_custom = plan == "custom"
 
-        self._custom_limit_label.setVisible(is_custom)
-        self._custom_limit_spin.setVisible(is_custom)
+        if is_custom and self._custom_limit_spin is None:
+            self._build_custom_limit()
+
+        if self._custom_limit_spin is not None and self._custom_limit_label is not None:
+            self._custom_limit_label.setVisible(is_custom)
+            self._custom_limit_spin.setVisible(is_custom)
+
+    def _build_custom_limit(self) -> None:
+        """Create the custom limit row."""
+        self._custom_limit_spin = QSpinBox()
+        self._custom_limit_spin.setRange(1000, 1_000_000)
+        self._custom_limit_spin.setSingleStep(1000)
+        self._custom_limit_spin.setSuffix(" tokens")
+        self._custom_limit_spin.setToolTip("Token limit for custom plan")
+        self._custom_limit_spin.setValue(
+            self._settings.custom_limit_tokens or _DEFAULT_CUSTOM_LIMIT
+        )
+        self._custom_limit_label = QLabel("Custom Limit:")
+        self._plan_layout.addRow(self._custom_limit_label, self._custom_limit_spin)
 
     def _on_accept(self) -> None:
         """Handle OK button click."""
@@ -198,8 +248,9 @@ class SettingsDialog(QDialog):
         critical = self._critical_spin.value()
 
         if critical <= warning:
-            critical = warning + 5
-            self._critical_spin.setValue(min(100, critical))
+            critical = min(100, warning + 5)
+            with QSignalBlocker(self._critical_spin):
+                self._critical_spin.setValue(critical)
 
         # Create updated settings
         new_settings = TraySettings(
@@ -208,10 +259,11 @@ class SettingsDialog(QDialog):
             custom_limit_tokens=(
                 self._custom_limit_spin.value()
                 if self._plan_combo.currentData() == "custom"
+                and self._custom_limit_spin is not None
                 else None
             ),
-            warning_threshold=self._warning_spin.value() / 100.0,
-            critical_threshold=self._critical_spin.value() / 100.0,
+            warning_threshold=warning / 100.0,
+            critical_threshold=critical / 100.0,
             autostart=self._autostart_check.isChecked(),
             show_notifications=self._notifications_check.isChecked(),
             notification_threshold=self._notif_threshold_spin.value() / 100.0,
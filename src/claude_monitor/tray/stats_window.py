@@ -1,9 +1,12 @@
 """Simple stats window that displays status from JSON."""
 
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -13,6 +16,26 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from claude_monitor.tray.status_generator import parse_reset_epoch
+
+# (divisor, suffix) pairs for compact number formatting, largest first
+_UNITS = ((1_000_000, "M"), (1_000, "k"))
+
+# Single stylesheet for the window and its rows, matched by object name
+_STATS_QSS = """
+QWidget { background: #2a2a2a; color: #e0e0e0; font-family: sans-serif; }
+QLabel#statsTitle { font-weight: bold; font-size: 15px; }
+QLabel#statsPlan { color: #888; font-size: 11px; }
+QFrame#statsSeparator { background: #3a3a3a; }
+QLabel#statsReset { color: #888; font-size: 12px; }
+QLabel#statsUpdated { color: #666; font-size: 11px; }
+QLabel#usageRowTitle { color: #e0e0e0; font-weight: bold; font-size: 13px; }
+QLabel#usageRowSubtitle { color: #888888; font-size: 11px; }
+QLabel#usageRowPct { color: #888888; font-size: 12px; }
+QProgressBar#usageBar { background: #3a3a3a; border: none; border-radius: 4px; }
+QProgressBar#usageBar::chunk { background: #5c9ce6; border-radius: 4px; }
+"""
+
 
 class UsageRow(QWidget):
     """Usage row with progress bar."""
@@ -24,28 +47,25 @@ class UsageRow(QWidget):
         layout.setSpacing(4)
 
         self._title = QLabel(title)
-        self._title.setStyleSheet("color: #e0e0e0; font-weight: bold; font-size: 13px;")
+        self._title.setObjectName("usageRowTitle")
         layout.addWidget(self._title)
 
         self._subtitle = QLabel("")
-        self._subtitle.setStyleSheet("color: #888888; font-size: 11px;")
+        self._subtitle.setObjectName("usageRowSubtitle")
         layout.addWidget(self._subtitle)
 
         row = QHBoxLayout()
         row.setSpacing(16)
 
         self._bar = QProgressBar()
+        self._bar.setObjectName("usageBar")
         self._bar.setRange(0, 100)
         self._bar.setTextVisible(False)
         self._bar.setFixedHeight(8)
-        self._bar.setStyleSheet("""
-            QProgressBar { background: #3a3a3a; border: none; border-radius: 4px; }
-            QProgressBar::chunk { background: #5c9ce6; border-radius: 4px; }
-        """)
         row.addWidget(self._bar, 1)
 
         self._pct = QLabel("0%")
-        self._pct.setStyleSheet("color: #888888; font-size: 12px;")
+        self._pct.setObjectName("usageRowPct")
         self._pct.setFixedWidth(60)
         self._pct.setAlignment(Qt.AlignmentFlag.AlignRight)
         row.addWidget(self._pct)
@@ -53,14 +73,23 @@ class UsageRow(QWidget):
         layout.addLayout(row)
 
     def update(self, pct: int, subtitle: str = "") -> None:
-        self._bar.setValue(min(100, max(0, pct)))
-        self._pct.setText(f"{pct}%")
-        self._subtitle.setText(subtitle)
+        # Batch the three child updates into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._bar.setValue(min(100, max(0, pct)))
+            self._pct.setText(f"{pct}%")
+            self._subtitle.setText(subtitle)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class StatsWindow(QWidget):
     """Stats window styled like Claude.ai usage page."""
 
+    closed = pyqtSignal()
+
+    UPDATE_THROTTLE_MS = 50
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Claude Usage")
@@ -70,9 +99,7 @@ class StatsWindow(QWidget):
             Qt.WindowType.WindowCloseButtonHint
         )
         self.setFixedWidth(420)
-        self.setStyleSheet("""
-            QWidget { background: #2a2a2a; color: #e0e0e0; font-family: sans-serif; }
-        """)
+        self.setStyleSheet(_STATS_QSS)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -80,11 +107,11 @@ class StatsWindow(QWidget):
 
         # Title
         title = QLabel("Plan usage limits")
-        title.setStyleSheet("font-weight: bold; font-size: 15px;")
+        title.setObjectName("statsTitle")
         layout.addWidget(title)
 
         self._plan_label = QLabel("Plan: --")
-        self._plan_label.setStyleSheet("color: #888; font-size: 11px;")
+        self._plan_label.setObjectName("statsPlan")
         layout.addWidget(self._plan_label)
         layout.addSpacing(12)
 
@@ -104,88 +131,176 @@ class StatsWindow(QWidget):
         layout.addSpacing(8)
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("background: #3a3a3a;")
+        sep.setObjectName("statsSeparator")
         sep.setFixedHeight(1)
         layout.addWidget(sep)
         layout.addSpacing(8)
 
         # Time to reset
         self._reset_label = QLabel("Time to reset: --")
-        self._reset_label.setStyleSheet("color: #888; font-size: 12px;")
+        self._reset_label.setObjectName("statsReset")
         layout.addWidget(self._reset_label)
 
         # Last updated
         layout.addSpacing(12)
         self._updated_label = QLabel("Last updated: --")
-        self._updated_label.setStyleSheet("color: #666; font-size: 11px;")
+        self._updated_label.setObjectName("statsUpdated")
         layout.addWidget(self._updated_label)
 
+        # Update throttling and change detection
+        self._last_status_key: Optional[Tuple[Any, ...]] = None
+        self._prev: Dict[str, Tuple[int, str]] = {}
+        self._pending_status: Optional[Dict[str, Any]] = None
+        self._has_pending = False
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(self.UPDATE_THROTTLE_MS)
+        self._throttle_timer.timeout.connect(self._flush_pending)
+
+    def closeEvent(self, event: Optional[QCloseEvent]) -> None:
+        """Notify listeners that the window was closed."""
+        super().closeEvent(event)
+        self.closed.emit()
+
     def update_status(self, status: Optional[Dict[str, Any]]) -> None:
-        """Update from status dict."""
+        """Update from status dict, throttled to one apply per interval.
+
+        Updates arriving while the throttle timer runs are coalesced and only
+        the latest one is applied when it fires.
+        """
+        if self._throttle_timer.isActive():
+            self._pending_status = status
+            self._has_pending = True
+            return
+        self._apply_status(status)
+        self._throttle_timer.start()
+
+    def _flush_pending(self) -> None:
+        """Apply the latest status received while throttled."""
+        if self._has_pending:
+            self._has_pending = False
+            status, self._pending_status = self._pending_status, None
+            self._apply_status(status)
+            self._throttle_timer.start()
+
+    def _apply_status(self, status: Optional[Dict[str, Any]]) -> None:
+        """Apply a status dict, touching only clock labels if usage is unchanged."""
         if not status or "error" in status:
+            self._last_status_key = None
             self._plan_label.setText("Plan: Error")
             return
 
-        plan = status.get("plan", "unknown")
-        self._plan_label.setText(f"Plan: {plan}")
-
         session = status.get("session", {})
-
-        # Tokens
+        plan = status.get("plan", "unknown")
         tokens = session.get("tokens", 0)
         token_limit = status.get("token_limit", 1)
         token_pct = session.get("tokens_pct", 0)
-        self._token_row.update(token_pct, f"{self._fmt(tokens)} / {self._fmt(token_limit)}")
-
-        # Cost
         cost = session.get("cost", 0)
         cost_limit = status.get("cost_limit", 1)
         cost_pct = session.get("cost_pct", 0)
-        self._cost_row.update(cost_pct, f"${cost:.2f} / ${cost_limit:.2f}")
-
-        # Messages
         msgs = session.get("messages", 0)
         msg_limit = status.get("message_limit", 1)
         msg_pct = session.get("messages_pct", 0)
-        self._msg_row.update(msg_pct, f"{msgs} / {msg_limit}")
-
-        # Reset time
         reset_time = session.get("reset_time", "")
-        self._reset_label.setText(f"Time to reset: {self._fmt_reset(reset_time)}")
-
-        # Updated
+        reset_epoch = session.get("reset_epoch")
         ts = status.get("timestamp", "")
-        self._updated_label.setText(f"Last updated: {self._fmt_time(ts)}")
+        ts_epoch = status.get("timestamp_epoch")
+
+        key = (
+            plan,
+            tokens,
+            token_limit,
+            token_pct,
+            cost,
+            cost_limit,
+            cost_pct,
+            msgs,
+            msg_limit,
+            msg_pct,
+        )
+        if key == self._last_status_key:
+            # The timestamp changes every refresh; only clock labels need work
+            self._update_time_labels(reset_time, reset_epoch, ts, ts_epoch)
+            return
+        self._last_status_key = key
 
-    def _fmt(self, n: int) -> str:
-        if n >= 1_000_000:
-            return f"{n/1_000_000:.1f}M"
-        if n >= 1_000:
-            return f"{n/1_000:.1f}k"
+        # Freeze repaints so all changes land in a single paint; re-enabling
+        # updates schedules that repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._plan_label.setText(f"Plan: {plan}")
+
+            # Tokens
+            self._update_row(
+                "tokens",
+                self._token_row,
+                token_pct,
+                f"{self._fmt(tokens)} / {self._fmt(token_limit)}",
+            )
+
+            # Cost
+            self._update_row(
+                "cost", self._cost_row, cost_pct, f"${cost:.2f} / ${cost_limit:.2f}"
+            )
+
+            # Messages
+            self._update_row(
+                "messages", self._msg_row, msg_pct, f"{msgs} / {msg_limit}"
+            )
+
+            self._update_time_labels(reset_time, reset_epoch, ts, ts_epoch)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _update_time_labels(
+        self,
+        reset_time: str,
+        reset_epoch: Optional[float],
+        ts: str,
+        ts_epoch: Optional[float],
+    ) -> None:
+        """Update the reset countdown and last-updated labels."""
+        self._reset_label.setText(
+            f"Time to reset: {self._fmt_reset(reset_time, reset_epoch)}"
+        )
+        self._updated_label.setText(f"Last updated: {self._fmt_time(ts, ts_epoch)}")
+
+    def _update_row(self, key: str, row: UsageRow, pct: int, subtitle: str) -> None:
+        """Update a usage row only if its values changed."""
+        values = (pct, subtitle)
+        if self._prev.get(key) != values:
+            self._prev[key] = values
+            row.update(pct, subtitle)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _fmt(n: int) -> str:
+        for divisor, suffix in _UNITS:
+            if n >= divisor:
+                return f"{n / divisor:.1f}{suffix}"
         return str(n)
 
-    def _fmt_reset(self, reset_time: str) -> str:
-        if not reset_time:
+    def _fmt_reset(self, reset_time: str, reset_epoch: Optional[float] = None) -> str:
+        if reset_epoch is None:
+            # Status written without epoch fields
+            reset_epoch = parse_reset_epoch(reset_time)
+            if reset_epoch is None:
+                return "--"
+        remaining = int(reset_epoch - time.time())
+        if remaining <= 0:
             return "--"
-        try:
-            if "+" in reset_time:
-                reset_time = reset_time.split("+")[0]
-            end = datetime.fromisoformat(reset_time)
-            now = datetime.now()
-            if end > now:
-                delta = end - now
-                h = int(delta.total_seconds() // 3600)
-                m = int((delta.total_seconds() % 3600) // 60)
-                return f"{h}h {m}m"
-        except:
-            pass
-        return "--"
-
-    def _fmt_time(self, ts: str) -> str:
-        if not ts:
+        h, rest = divmod(remaining, 3600)
+        return f"{h}h {rest // 60}m"
+
+    def _fmt_time(self, ts: str, ts_epoch: Optional[float] = None) -> str:
+        if ts_epoch is not None:
+            return time.strftime("%H:%M:%S", time.localtime(ts_epoch))
+
+        # Status written without epoch fields; skip parsing non-ISO values
+        if not ts or "T" not in ts:
             return "--"
         try:
             dt = datetime.fromisoformat(ts)
             return dt.strftime("%H:%M:%S")
-        except:
+        except (ValueError, TypeError):
             return "--"
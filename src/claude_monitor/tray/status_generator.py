@@ -1,37 +1,93 @@
 """Generate status file for tray app by calling claude-monitor internals."""
 
+import hashlib
 import json
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from claude_monitor.core.plans import Plans
+from claude_monitor.core.plans import PlanConfig, Plans
 from claude_monitor.data.analysis import analyze_usage
+from claude_monitor.tray.jsonio import dumps, loads
 
 logger = logging.getLogger(__name__)
 
 STATUS_FILE = Path.home() / ".claude-monitor" / "tray_status.json"
 
+# Successful results are reused briefly so back-to-back refreshes (manual
+# refresh, settings changes) skip the usage scan. Kept below the minimum
+# refresh rate (settings.MIN_REFRESH_RATE, enforced for the CLI flag and the
+# settings file) so scheduled ticks always see fresh data.
+_CACHE_TTL = 5  # seconds
+_STATUS_CACHE: Dict[str, Any] = {"ts": 0.0, "plan": None, "data": None}
+
+# Hash of the last written payload (excluding timestamp) to skip no-op writes
+_last_payload_hash: Optional[bytes] = None
+# Set once the status directory is known to exist
+_status_dir_ready = False
+
+
+def _pct(value: float, limit: float) -> int:
+    """Usage percentage clamped to 0-100 (0 when there is no limit)."""
+    if limit <= 0:
+        return 0
+    return max(0, min(100, int(value / limit * 100)))
+
+
+def parse_reset_epoch(reset_time: str) -> Optional[float]:
+    """Convert an ISO reset time to epoch seconds (None if empty or invalid).
+
+    The UTC offset is honoured; a trailing ``Z`` is accepted on Python 3.9.
+    """
+    if not reset_time:
+        return None
+    if reset_time.endswith("Z"):
+        reset_time = reset_time[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(reset_time).timestamp()
+    except (ValueError, TypeError):
+        logger.debug(f"Invalid reset time: {reset_time!r}")
+        return None
+
+
+@lru_cache(maxsize=8)
+def _plan_meta(plan: str) -> Optional[PlanConfig]:
+    """Plan config by name, memoized since plan metadata never changes."""
+    return Plans.get_plan_by_name(plan)
+
 
 def generate_status(plan: str = "max20") -> Dict[str, Any]:
     """Generate status data using claude-monitor internals."""
+    started = time.monotonic()
+    # One clock read per call, shared by every branch below
+    now = datetime.now()
+    now_iso = now.isoformat()
+    cached = _STATUS_CACHE["data"]
+    if (
+        cached is not None
+        and _STATUS_CACHE["plan"] == plan
+        and started - _STATUS_CACHE["ts"] < _CACHE_TTL
+    ):
+        status = dict(cached)
+        status["timestamp"] = now_iso
+        status["timestamp_epoch"] = now.timestamp()
+        return status
+
     try:
-        data = analyze_usage(hours_back=192, use_cache=False)
+        data = analyze_usage(hours_back=192, use_cache=True)
 
         if not data:
-            return {"error": "No data available", "timestamp": datetime.now().isoformat()}
+            return {"error": "No data available", "timestamp": now_iso}
 
         blocks = data.get("blocks", [])
 
         # Find active or most recent block
-        current_block = None
-        for block in blocks:
-            if block.get("isActive"):
-                current_block = block
-                break
-        if not current_block and blocks:
-            current_block = blocks[0]
+        current_block = next(
+            (b for b in blocks if b.get("isActive")), blocks[0] if blocks else None
+        )
 
         # Get token limit for plan
         token_limit = Plans.get_token_limit(plan, blocks)
@@ -51,31 +107,30 @@ def generate_status(plan: str = "max20") -> Dict[str, Any]:
             session_messages = current_block.get("sentMessagesCount", 0)
             reset_time = current_block.get("endTime", "")
 
-        # Percentage
-        session_pct = int((session_tokens / token_limit * 100)) if token_limit > 0 else 0
+        # Pre-parse reset time so the UI only does arithmetic
+        reset_epoch = parse_reset_epoch(reset_time)
 
         # Plan config
-        plan_config = Plans.get_plan_by_name(plan)
+        plan_config = _plan_meta(plan)
         cost_limit = plan_config.cost_limit if plan_config else 140.0
         message_limit = plan_config.message_limit if plan_config else 2000
 
-        cost_pct = int((session_cost / cost_limit * 100)) if cost_limit > 0 else 0
-        message_pct = int((session_messages / message_limit * 100)) if message_limit > 0 else 0
-
-        return {
-            "timestamp": datetime.now().isoformat(),
+        status = {
+            "timestamp": now_iso,
+            "timestamp_epoch": now.timestamp(),
             "plan": plan,
             "token_limit": token_limit,
             "cost_limit": cost_limit,
             "message_limit": message_limit,
             "session": {
                 "tokens": session_tokens,
-                "tokens_pct": min(100, session_pct),
+                "tokens_pct": _pct(session_tokens, token_limit),
                 "cost": session_cost,
-                "cost_pct": min(100, cost_pct),
+                "cost_pct": _pct(session_cost, cost_limit),
                 "messages": session_messages,
-                "messages_pct": min(100, message_pct),
+                "messages_pct": _pct(session_messages, message_limit),
                 "reset_time": reset_time,
+                "reset_epoch": reset_epoch,
                 "is_active": current_block.get("isActive", False) if current_block else False,
             },
             "totals": {
@@ -85,34 +140,74 @@ def generate_status(plan: str = "max20") -> Dict[str, Any]:
                 "total_cost": data.get("total_cost", 0.0),
             }
         }
+        _STATUS_CACHE.update(ts=started, plan=plan, data=status)
+        return status
 
     except Exception as e:
         logger.exception(f"Error generating status: {e}")
-        return {"error": str(e), "timestamp": datetime.now().isoformat()}
+        return {"error": str(e), "timestamp": now_iso}
+
+
+def _write(status: Dict[str, Any]) -> bool:
+    """Write status to the status file.
+
+    The write is skipped when nothing but the timestamps changed since the
+    last one.
 
+    Returns:
+        False if encoding or writing failed
+    """
+    global _last_payload_hash, _status_dir_ready
 
-def write_status_file(plan: str = "max20") -> bool:
-    """Generate and write status to file."""
     try:
-        status = generate_status(plan)
-        STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            k: v
+            for k, v in status.items()
+            if k not in ("timestamp", "timestamp_epoch")
+        }
+        payload_hash = hashlib.blake2b(
+            dumps(payload, sort_keys=True), digest_size=8
+        ).digest()
+        if payload_hash == _last_payload_hash and STATUS_FILE.exists():
+            return True
+
+        if not _status_dir_ready:
+            STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _status_dir_ready = True
         temp_file = STATUS_FILE.with_suffix(".tmp")
-        with open(temp_file, "w") as f:
-            json.dump(status, f, indent=2)
+        # Compact encoding: the file is only consumed programmatically
+        temp_file.write_bytes(dumps(status))
         temp_file.replace(STATUS_FILE)
+        _last_payload_hash = payload_hash
         return True
     except Exception as e:
+        # Re-check the directory next time in case it was removed
+        _status_dir_ready = False
         logger.exception(f"Error writing status file: {e}")
         return False
 
 
+def write_status_file(plan: str = "max20") -> Dict[str, Any]:
+    """Generate status, write it to file and return it.
+
+    The file is kept for other processes; callers in this process should
+    use the returned dict instead of reading the file back. Write failures
+    are logged and the status is returned regardless.
+    """
+    status = generate_status(plan)
+    _write(status)
+    return status
+
+
 def read_status_file() -> Optional[Dict[str, Any]]:
-    """Read status from file."""
+    """Read status from file.
+
+    Meant for external readers; the tray only calls this once at startup.
+    """
     if not STATUS_FILE.exists():
         return None
     try:
-        with open(STATUS_FILE) as f:
-            return json.load(f)
+        return loads(STATUS_FILE.read_bytes())
     except Exception as e:
         logger.warning(f"Error reading status file: {e}")
         return None
@@ -121,11 +216,9 @@ def read_status_file() -> Optional[Dict[str, Any]]:
 if __name__ == "__main__":
     import sys
     plan = sys.argv[1] if len(sys.argv) > 1 else "max20"
-    if write_status_file(plan):
-        print(f"Status written to {STATUS_FILE}")
-        status = read_status_file()
-        if status:
-            print(json.dumps(status, indent=2))
-    else:
+    status = generate_status(plan)
+    if not _write(status):
         print("Failed", file=sys.stderr)
         sys.exit(1)
+    print(f"Status written to {STATUS_FILE}")
+    print(json.dumps(status, indent=2))
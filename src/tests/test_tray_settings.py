@@ -0,0 +1,84 @@
+"""Tests for tray/settings.py persistence."""
+
+import json
+from pathlib import Path
+
+from claude_monitor.tray.settings import (
+    MAX_REFRESH_RATE,
+    MIN_REFRESH_RATE,
+    TraySettings,
+    TraySettingsManager,
+    clamp_refresh_rate,
+)
+
+
+class TestTraySettingsManagerSave:
+    """Test suite for TraySettingsManager.save."""
+
+    def test_save_writes_settings_file(self, tmp_path: Path) -> None:
+        """Test that saving writes the settings and a timestamp."""
+        manager = TraySettingsManager(tmp_path)
+
+        assert manager.save(TraySettings(plan="pro", refresh_rate=30))
+
+        data = json.loads(manager.settings_file.read_text())
+        assert data["plan"] == "pro"
+        assert data["refresh_rate"] == 30
+        assert "timestamp" in data
+
+    def test_save_skips_write_when_unchanged(self, tmp_path: Path) -> None:
+        """Test that saving equal settings twice writes only once."""
+        manager = TraySettingsManager(tmp_path)
+        manager.save(TraySettings(plan="pro"))
+        manager.settings_file.write_text("sentinel")
+
+        assert manager.save(TraySettings(plan="pro"))
+
+        assert manager.settings_file.read_text() == "sentinel"
+
+    def test_save_writes_when_changed(self, tmp_path: Path) -> None:
+        """Test that changed settings are written."""
+        manager = TraySettingsManager(tmp_path)
+        manager.save(TraySettings(plan="pro"))
+
+        assert manager.save(TraySettings(plan="max5"))
+
+        data = json.loads(manager.settings_file.read_text())
+        assert data["plan"] == "max5"
+
+    def test_save_rewrites_deleted_file(self, tmp_path: Path) -> None:
+        """Test that unchanged settings are written again if the file is gone."""
+        manager = TraySettingsManager(tmp_path)
+        manager.save(TraySettings(plan="pro"))
+        manager.settings_file.unlink()
+
+        assert manager.save(TraySettings(plan="pro"))
+
+        assert manager.settings_file.exists()
+
+    def test_save_skips_write_after_load(self, tmp_path: Path) -> None:
+        """Test that saving freshly loaded settings does not rewrite the file."""
+        TraySettingsManager(tmp_path).save(TraySettings(plan="max20"))
+        manager = TraySettingsManager(tmp_path)
+        settings = manager.load()
+        manager.settings_file.write_text("sentinel")
+
+        assert manager.save(settings)
+
+        assert manager.settings_file.read_text() == "sentinel"
+
+
+class TestRefreshRateBounds:
+    """Test suite for refresh rate clamping."""
+
+    def test_clamp_refresh_rate(self) -> None:
+        """Test that refresh rates are clamped to the supported range."""
+        assert clamp_refresh_rate(2) == MIN_REFRESH_RATE
+        assert clamp_refresh_rate(60) == 60
+        assert clamp_refresh_rate(1000) == MAX_REFRESH_RATE
+
+    def test_from_dict_clamps_refresh_rate(self) -> None:
+        """Test that a hand-edited refresh rate below the minimum is raised."""
+        settings = TraySettings.from_dict({"refresh_rate": 2})
+
+        assert settings.refresh_rate == MIN_REFRESH_RATE
@@ -0,0 +1,191 @@
+"""Tests for tray/status_generator.py."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from claude_monitor.tray import status_generator
+
+
+def _usage_data() -> Dict[str, Any]:
+    """Build analyze_usage output with a single active block."""
+    return {
+        "blocks": [
+            {
+                "isActive": True,
+                "tokenCounts": {"inputTokens": 1000, "outputTokens": 500},
+                "costUSD": 1.5,
+                "sentMessagesCount": 3,
+                "endTime": "2030-01-01T10:00:00+00:00",
+            }
+        ],
+        "entries_count": 1,
+        "total_tokens": 1500,
+        "total_cost": 1.5,
+    }
+
+
+@pytest.fixture
+def usage_calls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """Point the generator at a temp file and a fake analyze_usage.
+
+    Returns a list collecting the hours_back of each analyze_usage call.
+    """
+    calls: List[int] = []
+
+    def fake_analyze_usage(**kwargs: Any) -> Dict[str, Any]:
+        calls.append(kwargs["hours_back"])
+        return _usage_data()
+
+    monkeypatch.setattr(status_generator, "analyze_usage", fake_analyze_usage)
+    monkeypatch.setattr(status_generator, "STATUS_FILE", tmp_path / "status.json")
+    monkeypatch.setattr(status_generator, "_last_payload_hash", None)
+    monkeypatch.setattr(status_generator, "_status_dir_ready", False)
+    monkeypatch.setattr(
+        status_generator,
+        "_STATUS_CACHE",
+        {"ts": 0.0, "plan": None, "data": None},
+    )
+    return calls
+
+
+class TestPct:
+    """Test suite for _pct."""
+
+    @pytest.mark.parametrize(
+        "value, limit, expected",
+        [
+            (50, 100, 50),
+            (150, 100, 100),
+            (-10, 100, 0),
+            (10, 0, 0),
+            (10, -5, 0),
+        ],
+    )
+    def test_pct(self, value: float, limit: float, expected: int) -> None:
+        """Test clamping to 0-100 and zero/negative limits."""
+        assert status_generator._pct(value, limit) == expected
+
+
+class TestParseResetEpoch:
+    """Test suite for parse_reset_epoch."""
+
+    @pytest.mark.parametrize(
+        "reset_time",
+        [
+            "2030-01-01T10:00:00+00:00",
+            "2030-01-01T10:00:00Z",
+            "2030-01-01T12:00:00+02:00",
+        ],
+    )
+    def test_offset_is_honoured(self, reset_time: str) -> None:
+        """Test that the UTC offset is applied instead of dropped."""
+        assert status_generator.parse_reset_epoch(reset_time) == 1893492000.0
+
+    @pytest.mark.parametrize("reset_time", ["", "not a time"])
+    def test_invalid_returns_none(self, reset_time: str) -> None:
+        """Test that empty and unparseable values give None."""
+        assert status_generator.parse_reset_epoch(reset_time) is None
+
+
+class TestGenerateStatus:
+    """Test suite for generate_status."""
+
+    def test_cache_hit_for_same_plan(self, usage_calls: List[int]) -> None:
+        """Test that a repeat call within the TTL reuses the result."""
+        first = status_generator.generate_status("pro")
+        second = status_generator.generate_status("pro")
+
+        assert len(usage_calls) == 1
+        assert second["session"] == first["session"]
+
+    def test_plan_change_misses_cache(self, usage_calls: List[int]) -> None:
+        """Test that a different plan bypasses the cached result."""
+        status_generator.generate_status("pro")
+        status = status_generator.generate_status("max5")
+
+        assert len(usage_calls) == 2
+        assert status["plan"] == "max5"
+
+    def test_expired_cache_is_refreshed(self, usage_calls: List[int]) -> None:
+        """Test that the usage scan runs again once the TTL has passed."""
+        status_generator.generate_status("pro")
+        status_generator._STATUS_CACHE["ts"] -= status_generator._CACHE_TTL
+
+        status_generator.generate_status("pro")
+
+        assert len(usage_calls) == 2
+
+    def test_reset_epoch_is_utc_instant(self, usage_calls: List[int]) -> None:
+        """Test that reset_epoch is the UTC instant of the block end time."""
+        status = status_generator.generate_status("pro")
+
+        assert status["session"]["reset_epoch"] == 1893492000.0
+
+
+class TestWriteStatusFile:
+    """Test suite for write_status_file."""
+
+    def test_writes_status(self, usage_calls: List[int]) -> None:
+        """Test that the returned status is written to the file."""
+        status = status_generator.write_status_file("pro")
+
+        data = json.loads(status_generator.STATUS_FILE.read_text())
+        assert data == status
+
+    def test_skips_write_when_only_timestamp_changed(
+        self, usage_calls: List[int]
+    ) -> None:
+        """Test that an unchanged payload is not written again."""
+        status_generator.write_status_file("pro")
+        status_generator.STATUS_FILE.write_text("sentinel")
+
+        status_generator.write_status_file("pro")
+
+        assert status_generator.STATUS_FILE.read_text() == "sentinel"
+
+    def test_rewrites_deleted_file(self, usage_calls: List[int]) -> None:
+        """Test that an unchanged payload is written again if the file is gone."""
+        status_generator.write_status_file("pro")
+        status_generator.STATUS_FILE.unlink()
+
+        status_generator.write_status_file("pro")
+
+        assert status_generator.STATUS_FILE.exists()
+
+    def test_encode_error_does_not_raise(
+        self, usage_calls: List[int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that encoder failures are logged and the status still returned."""
+
+        def failing_dumps(obj: Any, **kwargs: Any) -> bytes:
+            raise TypeError("not serializable")
+
+        monkeypatch.setattr(status_generator, "dumps", failing_dumps)
+
+        status = status_generator.write_status_file("pro")
+
+        assert status["plan"] == "pro"
+        assert not status_generator.STATUS_FILE.exists()
+
+    def test_write_reports_failure(
+        self, usage_calls: List[int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that _write returns False when the file cannot be written."""
+
+        def failing_dumps(obj: Any, **kwargs: Any) -> bytes:
+            raise TypeError("not serializable")
+
+        status = status_generator.generate_status("pro")
+        monkeypatch.setattr(status_generator, "dumps", failing_dumps)
+
+        assert status_generator._write(status) is False
+
+    def test_write_reports_success(self, usage_calls: List[int]) -> None:
+        """Test that _write returns True for written and skipped writes."""
+        status = status_generator.generate_status("pro")
+
+        assert status_generator._write(status) is True
+        assert status_generator._write(status) is True